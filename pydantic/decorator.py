@@ -1,9 +1,10 @@
 from functools import update_wrapper
-from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Tuple, TypeVar, cast, get_type_hints
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Mapping, Set, Tuple, Type, TypeVar, cast, get_type_hints
+from weakref import WeakValueDictionary
 
 from . import validator
 from .errors import ConfigError
-from .main import BaseModel, Extra, create_model
+from .main import BaseModel, Extra, create_model, validate_model
 from .utils import to_camel
 
 __all__ = ('validate_arguments',)
@@ -26,6 +27,12 @@ def validate_arguments(function: 'Callable') -> 'Callable':
 ALT_V_ARGS = 'v__args'
 ALT_V_KWARGS = 'v__kwargs'
 V_POSITIONAL_ONLY_NAME = 'v__positional_only'
+V_DUPLICATE_KWARGS = 'v__duplicate_kwargs'
+RESERVED_NAMES = frozenset((ALT_V_ARGS, ALT_V_KWARGS, V_POSITIONAL_ONLY_NAME, V_DUPLICATE_KWARGS))
+
+# models are kept here while any function using them is alive so decorating the same function definition again
+# (e.g. inside a factory) doesn't have to build a new model
+_model_cache: 'WeakValueDictionary[Tuple[Any, ...], Type[BaseModel]]' = WeakValueDictionary()
 
 
 class ValidatedFunction:
@@ -34,10 +41,10 @@ class ValidatedFunction:
 
         parameters: Mapping[str, Parameter] = signature(function).parameters
 
-        if parameters.keys() & {ALT_V_ARGS, ALT_V_KWARGS, V_POSITIONAL_ONLY_NAME}:
+        if not parameters.keys().isdisjoint(RESERVED_NAMES):
             raise ConfigError(
-                f'"{ALT_V_ARGS}", "{ALT_V_KWARGS}" and "{V_POSITIONAL_ONLY_NAME}" are not permitted as argument '
-                f'names when using the "{validate_arguments.__name__}" decorator'
+                f'"{ALT_V_ARGS}", "{ALT_V_KWARGS}", "{V_POSITIONAL_ONLY_NAME}" and "{V_DUPLICATE_KWARGS}" '
+                f'are not permitted as argument names when using the "{validate_arguments.__name__}" decorator'
             )
 
         self.raw_function = function
@@ -47,81 +54,100 @@ class ValidatedFunction:
         self.v_kwargs_name = 'kwargs'
 
         type_hints = get_type_hints(function)
-        takes_args = False
-        takes_kwargs = False
+        self.takes_args = False
+        self.takes_kwargs = False
         fields: Dict[str, Tuple[Any, Any]] = {}
+        # bound to locals to avoid repeated attribute lookups for every parameter
+        empty = Parameter.empty
         for i, (name, p) in enumerate(parameters.items()):
-            if p.annotation == p.empty:
+            if p.annotation is empty:
                 annotation = Any
             else:
                 annotation = type_hints[name]
 
-            default = ... if p.default == p.empty else p.default
-            if p.kind == Parameter.POSITIONAL_ONLY:
+            default = ... if p.default is empty else p.default
+            kind = p.kind
+            if kind == Parameter.POSITIONAL_ONLY:
                 self.arg_mapping[i] = name
                 fields[name] = annotation, default
-                fields[V_POSITIONAL_ONLY_NAME] = List[str], None
+                if not self.positional_only_args:
+                    # field used to report positional-only arguments passed by keyword, see build_values
+                    fields[V_POSITIONAL_ONLY_NAME] = List[str], None
                 self.positional_only_args.add(name)
-            elif p.kind == Parameter.POSITIONAL_OR_KEYWORD:
+            elif kind == Parameter.POSITIONAL_OR_KEYWORD:
                 self.arg_mapping[i] = name
                 fields[name] = annotation, default
-            elif p.kind == Parameter.KEYWORD_ONLY:
+            elif kind == Parameter.KEYWORD_ONLY:
                 fields[name] = annotation, default
-            elif p.kind == Parameter.VAR_POSITIONAL:
+            elif kind == Parameter.VAR_POSITIONAL:
                 self.v_args_name = name
                 fields[name] = Tuple[annotation, ...], None
-                takes_args = True
+                self.takes_args = True
             else:
-                assert p.kind == Parameter.VAR_KEYWORD, p.kind
+                # the only remaining kind is VAR_KEYWORD
                 self.v_kwargs_name = name
                 fields[name] = Dict[str, annotation], None  # type: ignore
-                takes_kwargs = True
+                self.takes_kwargs = True
+
+        if self.arg_mapping:
+            # same for arguments given both positionally and by keyword
+            fields[V_DUPLICATE_KWARGS] = List[str], None
 
         # these checks avoid a clash between "args" and a field with that name
-        if not takes_args and self.v_args_name in fields:
+        if not self.takes_args and self.v_args_name in fields:
             self.v_args_name = ALT_V_ARGS
 
         # same with "kwargs"
-        if not takes_kwargs and self.v_kwargs_name in fields:
+        if not self.takes_kwargs and self.v_kwargs_name in fields:
             self.v_kwargs_name = ALT_V_KWARGS
 
-        if not takes_args:
+        if not self.takes_args:
             # we add the field so validation below can raise the correct exception
             fields[self.v_args_name] = List[Any], None
 
-        if not takes_kwargs:
+        if not self.takes_kwargs:
             # same with kwargs
             fields[self.v_kwargs_name] = Dict[Any, Any], None
 
-        self.create_model(fields, takes_args, takes_kwargs)
+        # positional parameters always come first, so arg_mapping keys are 0..n-1 and can be zipped against args
+        self.positional_names: Tuple[str, ...] = tuple(self.arg_mapping.values())
+        self.positional_only_names: Tuple[str, ...] = self.positional_names[: len(self.positional_only_args)]
+        # fields passed positionally when *args is populated, so execute can find the keyword fields in one step
+        self.var_args_positional: FrozenSet[str] = frozenset(self.positional_names + (self.v_args_name,))
+        # names of parameters (other than *args and **kwargs) which keyword arguments are matched against, built once
+        # here so build_values doesn't need the model's fields which also include internal fields like "v__args"
+        var_kinds = Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD
+        self.non_var_params: FrozenSet[str] = frozenset(
+            name for name, p in parameters.items() if p.kind not in var_kinds
+        )
+
+        self.create_model(fields, self.takes_args, self.takes_kwargs)
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         values = self.build_values(args, kwargs)
-        m = self.model(**values)
-        return self.execute(m)
+        # validate_model is called directly rather than instantiating the model since only the validated values
+        # are required, this avoids the overhead of BaseModel.__init__ on every call
+        validated, fields_set, validation_error = validate_model(self.model, values)
+        if validation_error:
+            raise validation_error
+        return self.execute(validated, fields_set)
 
     def build_values(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Dict[str, Any]:
-        values: Dict[str, Any] = {}
-        if args:
-            arg_iter = enumerate(args)
-            while True:
-                try:
-                    i, a = next(arg_iter)
-                except StopIteration:
-                    break
-                arg_name = self.arg_mapping.get(i)
-                if arg_name is not None:
-                    values[arg_name] = a
-                else:
-                    values[self.v_args_name] = [a] + [a for _, a in arg_iter]
-                    break
+        values: Dict[str, Any] = dict(zip(self.positional_names, args))
+        pos_count = len(self.positional_names)
+        if len(args) > pos_count:
+            values[self.v_args_name] = list(args[pos_count:])
 
         var_kwargs = {}
         wrong_positional_args = []
+        duplicate_kwargs = []
         for k, v in kwargs.items():
-            if k in self.model.__fields__:
+            if k in self.non_var_params:
+                # checked against the values already bound from args rather than binding the signature again
                 if k in self.positional_only_args:
                     wrong_positional_args.append(k)
+                elif k in values:
+                    duplicate_kwargs.append(k)
                 values[k] = v
             else:
                 var_kwargs[k] = v
@@ -130,66 +156,86 @@ class ValidatedFunction:
             values[self.v_kwargs_name] = var_kwargs
         if wrong_positional_args:
             values[V_POSITIONAL_ONLY_NAME] = wrong_positional_args
+        if duplicate_kwargs:
+            values[V_DUPLICATE_KWARGS] = duplicate_kwargs
         return values
 
-    def execute(self, m: BaseModel) -> Any:
-        d = {k: v for k, v in m._iter() if k in m.__fields_set__}
-        kwargs = d.pop(self.v_kwargs_name, None)
-        if kwargs:
-            d.update(kwargs)
-
-        if self.v_args_name in d:
-            args_: List[Any] = []
-            in_kwargs = False
-            kwargs = {}
-            for name, value in d.items():
-                if in_kwargs:
-                    kwargs[name] = value
-                elif name == self.v_args_name:
-                    args_ += value
-                    in_kwargs = True
-                else:
-                    args_.append(value)
-            return self.raw_function(*args_, **kwargs)
+    def execute(self, values: Dict[str, Any], fields_set: Set[str]) -> Any:
+        # values are picked straight out of the validated dict rather than rebuilding and re-walking a filtered copy
+        # without *args in the signature the field can't be set on a successful validation, so skip looking for it
+        if self.takes_args and self.v_args_name in fields_set:
+            # *args is only populated once every positional argument has been given, so all are passed positionally
+            args_ = [values[name] for name in self.positional_names]
+            args_ += values[self.v_args_name]
+            keyword_names = fields_set - self.var_args_positional
         elif self.positional_only_args:
-            args_ = []
-            kwargs = {}
-            for name, value in d.items():
-                if name in self.positional_only_args:
-                    args_.append(value)
-                else:
-                    kwargs[name] = value
-            return self.raw_function(*args_, **kwargs)
+            args_ = [values[name] for name in self.positional_only_names if name in fields_set]
+            keyword_names = fields_set - self.positional_only_args
         else:
-            return self.raw_function(**d)
+            args_ = []
+            keyword_names = fields_set
+
+        kwargs = {name: values[name] for name in keyword_names}
+        # the signature's shape is fixed when the decorator is applied, var-kwargs only need merging if they're accepted
+        if self.takes_kwargs:
+            var_kwargs = kwargs.pop(self.v_kwargs_name, None)
+            if var_kwargs:
+                kwargs.update(var_kwargs)
+        return self.raw_function(*args_, **kwargs)
 
     def create_model(self, fields: Dict[str, Any], takes_args: bool, takes_kwargs: bool) -> None:
         pos_args = len(self.arg_mapping)
 
+        code = getattr(self.raw_function, '__code__', None)
+        cache_key = None
+        if code is not None:
+            # annotations and defaults are matched by identity rather than hashed and compared since equal types can
+            # validate differently (e.g. Union[int, str] == Union[str, int]), the model's fields hold these objects
+            # so their ids can't be reused while the entry exists
+            definition_ids = tuple(id(v) for definition in fields.values() for v in definition)
+            cache_key = code, self.raw_function.__name__, pos_args, tuple(fields), definition_ids
+            cached = _model_cache.get(cache_key)
+            if cached is not None:
+                self.model = cached
+                return
+
         class DecoratorBaseModel(BaseModel):
-            @validator(self.v_args_name, check_fields=False, allow_reuse=True)
-            def check_args(cls, v: List[Any]) -> List[Any]:
-                if takes_args:
-                    return v
+            # these validators only ever raise, so they're omitted when the function accepts *args or **kwargs
+            # rather than being called on every invocation just to return their input
+            if not takes_args:
+
+                @validator(self.v_args_name, check_fields=False, allow_reuse=True)
+                def check_args(cls, v: List[Any]) -> None:
+                    raise TypeError(f'{pos_args} positional arguments expected but {pos_args + len(v)} given')
+
+            if not takes_kwargs:
+
+                @validator(self.v_kwargs_name, check_fields=False, allow_reuse=True)
+                def check_kwargs(cls, v: Dict[str, Any]) -> None:
+                    plural = '' if len(v) == 1 else 's'
+                    keys = ', '.join(map(repr, v))
+                    raise TypeError(f'unexpected keyword argument{plural}: {keys}')
 
-                raise TypeError(f'{pos_args} positional arguments expected but {pos_args + len(v)} given')
+            # likewise these fields are only added for signatures where they can be populated
+            if V_POSITIONAL_ONLY_NAME in fields:
 
-            @validator(self.v_kwargs_name, check_fields=False, allow_reuse=True)
-            def check_kwargs(cls, v: Dict[str, Any]) -> Dict[str, Any]:
-                if takes_kwargs:
-                    return v
+                @validator(V_POSITIONAL_ONLY_NAME, check_fields=False, allow_reuse=True)
+                def check_positional_only(cls, v: List[str]) -> None:
+                    plural = '' if len(v) == 1 else 's'
+                    keys = ', '.join(map(repr, v))
+                    raise TypeError(f'positional-only argument{plural} passed as keyword argument{plural}: {keys}')
 
-                plural = '' if len(v) == 1 else 's'
-                keys = ', '.join(map(repr, v.keys()))
-                raise TypeError(f'unexpected keyword argument{plural}: {keys}')
+            if V_DUPLICATE_KWARGS in fields:
 
-            @validator(V_POSITIONAL_ONLY_NAME, check_fields=False, allow_reuse=True)
-            def check_positional_only(cls, v: List[str]) -> None:
-                plural = '' if len(v) == 1 else 's'
-                keys = ', '.join(map(repr, v))
-                raise TypeError(f'positional-only argument{plural} passed as keyword argument{plural}: {keys}')
+                @validator(V_DUPLICATE_KWARGS, check_fields=False, allow_reuse=True)
+                def check_duplicate_kwargs(cls, v: List[str]) -> None:
+                    plural = '' if len(v) == 1 else 's'
+                    keys = ', '.join(map(repr, v))
+                    raise TypeError(f'multiple values for argument{plural}: {keys}')
 
             class Config:
                 extra = Extra.forbid
 
         self.model = create_model(to_camel(self.raw_function.__name__), __base__=DecoratorBaseModel, **fields)
+        if cache_key is not None:
+            _model_cache[cache_key] = self.model
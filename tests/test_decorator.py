@@ -2,7 +2,7 @@ import asyncio
 import inspect
 import sys
 from pathlib import Path
-from typing import List
+from typing import List, Union
 
 import pytest
 
@@ -52,6 +52,20 @@ def test_args():
         {'loc': ('kwargs',), 'msg': "unexpected keyword argument: 'apple'", 'type': 'type_error'},
     ]
 
+    with pytest.raises(ValidationError) as exc_info:
+        foo(1, b=2, a=3)
+
+    assert exc_info.value.errors() == [
+        {'loc': ('v__duplicate_kwargs',), 'msg': "multiple values for argument: 'a'", 'type': 'type_error'},
+    ]
+
+    with pytest.raises(ValidationError) as exc_info:
+        foo(1, 2, args=3)
+
+    assert exc_info.value.errors() == [
+        {'loc': ('kwargs',), 'msg': "unexpected keyword argument: 'args'", 'type': 'type_error'},
+    ]
+
 
 def test_wrap():
     @validate_arguments
@@ -68,7 +82,7 @@ def test_wrap():
     assert foo_bar.arg_mapping == {0: 'a', 1: 'b'}
     assert foo_bar.positional_only_args == set()
     assert issubclass(foo_bar.model, BaseModel)
-    assert foo_bar.model.__fields__.keys() == {'a', 'b', 'args', 'kwargs'}
+    assert foo_bar.model.__fields__.keys() == {'a', 'b', 'args', 'kwargs', 'v__duplicate_kwargs'}
     assert foo_bar.model.__name__ == 'FooBar'
     # signature is slightly different on 3.6
     if sys.version_info >= (3, 7):
@@ -118,6 +132,15 @@ def test_var_args_kwargs():
     assert foo(1, 2, 3, d=4) == 'a=1, b=2, args=(3,), d=4, kwargs={}'
     assert foo(*[1, 2, 3], d=4) == 'a=1, b=2, args=(3,), d=4, kwargs={}'
     assert foo(1, 2, 3, e=10) == "a=1, b=2, args=(3,), d=3, kwargs={'e': 10}"
+    assert foo(1, 2, 3, args=4) == "a=1, b=2, args=(3,), d=3, kwargs={'args': 4}"
+    assert foo(1, 2, kwargs=4) == "a=1, b=2, args=(), d=3, kwargs={'kwargs': 4}"
+
+    with pytest.raises(ValidationError) as exc_info:
+        foo(1, 2, 3, a=4, b=5)
+
+    assert exc_info.value.errors() == [
+        {'loc': ('v__duplicate_kwargs',), 'msg': "multiple values for arguments: 'a', 'b'", 'type': 'type_error'},
+    ]
 
 
 @skip_pre_38
@@ -154,12 +177,35 @@ def foo(a, b, /, c=None):
     ]
 
 
+@skip_pre_38
+def test_positional_only_error_order(create_module):
+    module = create_module(
+        """
+from pydantic import validate_arguments
+
+@validate_arguments
+def foo(a, /, b, *, c=3):
+    return f'{a}, {b}, {c}'
+"""
+    )
+    with pytest.raises(ValidationError) as exc_info:
+        module.foo(a=1)
+    assert exc_info.value.errors() == [
+        {
+            'loc': ('v__positional_only',),
+            'msg': "positional-only argument passed as keyword argument: 'a'",
+            'type': 'type_error',
+        },
+        {'loc': ('b',), 'msg': 'field required', 'type': 'value_error.missing'},
+    ]
+
+
 def test_args_name():
     @validate_arguments
     def foo(args: int, kwargs: int):
         return f'args={args!r}, kwargs={kwargs!r}'
 
-    assert foo.model.__fields__.keys() == {'args', 'kwargs', 'v__args', 'v__kwargs'}
+    assert foo.model.__fields__.keys() == {'args', 'kwargs', 'v__args', 'v__kwargs', 'v__duplicate_kwargs'}
     assert foo(1, 2) == 'args=1, kwargs=2'
 
     with pytest.raises(ValidationError) as exc_info:
@@ -182,7 +228,10 @@ def test_args_name():
 
 
 def test_v_args():
-    with pytest.raises(ConfigError, match='"v__args", "v__kwargs" and "v__positional_only" are not permitted'):
+    with pytest.raises(
+        ConfigError,
+        match='"v__args", "v__kwargs", "v__positional_only" and "v__duplicate_kwargs" are not permitted',
+    ):
 
         @validate_arguments
         def foo(v__args: int):
@@ -220,3 +269,72 @@ def test_string_annotation():
         {'loc': ('a', 0), 'msg': 'value is not a valid integer', 'type': 'type_error.integer'},
         {'loc': ('b',), 'msg': 'field required', 'type': 'value_error.missing'},
     ]
+
+
+def test_default_with_custom_eq():
+    class Strict:
+        def __eq__(self, other):
+            raise TypeError('comparison not supported')
+
+    default = Strict()
+
+    @validate_arguments
+    def foo(a: int, b=default):
+        return a, b
+
+    assert foo(1) == (1, default)
+    assert foo('2', 3) == (2, 3)
+
+
+def test_model_reused():
+    def make(annotation, default=None):
+        @validate_arguments
+        def foo(a: annotation, b=default):
+            return a, b
+
+        return foo
+
+    f1, f2, f3, f4 = make(int), make(int), make(str), make(int, ['x'])
+    assert f1.model is f2.model
+    assert f1.model is not f3.model
+    assert f1.model is not f4.model
+    assert f1('1') == (1, None)
+    assert f3('1') == ('1', None)
+    assert f4('1') == (1, ['x'])
+
+
+def test_model_reused_equal_annotations():
+    def make(annotation):
+        @validate_arguments
+        def foo(a: annotation):
+            return a
+
+        return foo
+
+    # these compare equal but pydantic tries union members in order
+    int_first, str_first = make(Union[int, str]), make(Union[str, int])
+    assert int_first.model is not str_first.model
+    assert int_first('1') == 1
+    assert str_first('1') == '1'
+
+
+def test_default_hash_raises():
+    class BadHash:
+        def __hash__(self):
+            raise ValueError('not hashable')
+
+    default = BadHash()
+
+    @validate_arguments
+    def foo(a=default):
+        return a
+
+    assert foo() is default
+    assert foo(1) == 1
+
+
+def test_no_code_object():
+    validated_divmod = validate_arguments(divmod)
+    assert not hasattr(divmod, '__code__')
+    assert validated_divmod(7, 2) == (3, 1)
+    assert validated_divmod.model.__name__ == 'Divmod'